@@ -22,7 +22,7 @@ class MeView(RetrieveAPIView):
     serializer_class = UserSerializer
 
     def get_object(self):
-        return self.request.user
+        return UserModel.objects.all_with_profiles_and_cars().get(pk=self.request.user.pk)
 
 
 class ActivateUserView(GenericAPIView):
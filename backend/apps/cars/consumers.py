@@ -1,30 +1,197 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+
 from djangochannelsrestframework.decorators import action
 from djangochannelsrestframework.generics import GenericAsyncAPIConsumer
 from djangochannelsrestframework.observer import model_observer
 
+from core.services.socket_metrics_service import SocketMetricsService
+
 from apps.cars.models import CarModel
-from apps.cars.serializers import CarSerializer
+from apps.cars.serializers import CarActivityFilterSerializer
+
+logger = logging.getLogger(__name__)
 
 
 class CarConsumer(GenericAsyncAPIConsumer):
+    """
+        Matching car events go to a bounded per-connection outbox drained by one sender task.
+        send_json waits for the transport, so a slow client makes the outbox grow, and overflow
+        drops the oldest entry (followed by a 'resync' frame) or closes the connection.
+    """
+
     def __init__(self, *args, **kwargs):
         self.room_name = 'cars'
+        self.car_filters = {}
+        self.outbox: OrderedDict[tuple, tuple[str, dict, float]] = OrderedDict()
+        self.dropped: dict[str, int] = {}
+        self.pending = asyncio.Event()
+        self.sender_task: asyncio.Task | None = None
+        self.metrics = {'sent': 0, 'coalesced': 0, 'dropped': 0, 'disconnected': 0, 'send_lag_us': 0}
         super().__init__(*args, **kwargs)
 
     async def connect(self):
         if not self.scope['user']:
             await self.close()
+            return
         await self.accept()
         await self.channel_layer.group_add(
             self.room_name,
             self.channel_name
         )
+        self.sender_task = asyncio.create_task(self.__send_outbox())
+        self.sender_task.add_done_callback(self.__on_sender_done)
+
+    def __on_sender_done(self, task: asyncio.Task):
+        if task.cancelled() or task.exception() is None:
+            return
+        logger.error('Cars feed sender stopped, closing %s', self.channel_name, exc_info=task.exception())
+        asyncio.create_task(self.close())
+
+    async def disconnect(self, code):
+        if self.sender_task:
+            self.sender_task.cancel()
+        await self.flush_metrics()
+        await SocketMetricsService.remove_connection(self.room_name, self.channel_name)
+        await super().disconnect(code)
+
+    async def flush_metrics(self):
+        await SocketMetricsService.incr(self.room_name, **self.metrics)
+        self.metrics = dict.fromkeys(self.metrics, 0)
+
+    async def __enqueue(self, request_id, action, message: dict):
+        key = (request_id, message['id'])
+        message = {field: dict(value) if isinstance(value, dict) else value for field, value in message.items()}
+        if key in self.outbox:
+            queued_action, queued_message, enqueued_at = self.outbox[key]
+            if action == 'update' and queued_action != 'delete':
+                if queued_action == 'create':
+                    queued_message['car'].update(message['changes'])
+                else:
+                    queued_message.setdefault('changes', {}).update(message['changes'])
+                message, action = queued_message, queued_action
+            self.outbox[key] = (action, message, enqueued_at)
+            self.metrics['coalesced'] += 1
+            return
+        if len(self.outbox) >= settings.CAR_FEED_QUEUE_LIMIT:
+            if settings.CAR_FEED_OVERFLOW_POLICY == 'disconnect':
+                self.metrics['disconnected'] += 1
+                await self.close()
+                return
+            (dropped_request_id, _), _ = self.outbox.popitem(last=False)
+            self.dropped[dropped_request_id] = self.dropped.get(dropped_request_id, 0) + 1
+            self.metrics['dropped'] += 1
+        self.outbox[key] = (action, message, time.perf_counter())
+        self.pending.set()
 
-    @model_observer(CarModel, serializer_class=CarSerializer)
+    async def __send_outbox(self):
+        while True:
+            await self.pending.wait()
+            await asyncio.sleep(settings.CAR_FEED_COALESCE_WINDOW)
+            self.pending.clear()
+            await self.__store_metrics(len(self.outbox))
+            while self.outbox or self.dropped:
+                if self.dropped:
+                    dropped, self.dropped = self.dropped, {}
+                    for request_id, count in dropped.items():
+                        await self.reply(data={'dropped': count}, action='resync', request_id=request_id)
+                    continue
+                (request_id, _), (action, message, enqueued_at) = self.outbox.popitem(last=False)
+                await self.reply(data=message, action=action, request_id=request_id)
+                self.metrics['sent'] += 1
+                self.metrics['send_lag_us'] += int((time.perf_counter() - enqueued_at) * 1_000_000)
+            await self.__store_metrics(0, flush=True)
+
+    async def __store_metrics(self, depth: int, flush=False):
+        try:
+            await SocketMetricsService.set_gauge(self.room_name, self.channel_name, depth)
+            if flush:
+                await self.flush_metrics()
+        except Exception:
+            logger.exception('Cars feed metrics of %s could not be stored', self.channel_name)
+
+    @staticmethod
+    def __match(filters: dict, car: dict) -> bool:
+        price = car['price']
+        return (
+            (filters.get('price_gte') is None or price >= filters['price_gte'])
+            and (filters.get('price_lte') is None or price <= filters['price_lte'])
+            and all(filters.get(field) in (None, car[field]) for field in ('brand', 'model', 'user'))
+        )
+
+    @model_observer(CarModel)
     async def cars_activity(self, message, action, subscribing_request_ids, **kwargs):
+        car = message.pop('car')
+        previous_car = message.pop('previous_car', None)
+        snapshot = message.pop('snapshot')
         for request_id in subscribing_request_ids:
-            await self.reply(data=message, action=action, request_id=request_id)
+            if action == 'delete':
+                await self.__enqueue(request_id, 'delete', message)
+                continue
+            filters = self.car_filters.get(request_id, {})
+            matched = previous_car is not None and self.__match(filters, previous_car)
+            if not self.__match(filters, car):
+                if matched:
+                    await self.__enqueue(request_id, 'delete', {'id': message['id']})
+            elif matched:
+                await self.__enqueue(request_id, 'update', message)
+            else:
+                await self.__enqueue(request_id, 'create', {'id': message['id'], 'car': snapshot})
+
+    @cars_activity.serializer
+    def cars_activity(self, instance: CarModel, action, **kwargs):
+        message = {
+            'id': instance.pk,
+            'car': {
+                'brand': instance.brand, 'model': instance.model, 'price': instance.price, 'user': instance.user_id
+            },
+            'snapshot': instance.get_tracked_values(),
+        }
+        if hasattr(instance, '_loaded_values'):
+            message['previous_car'] = {
+                field: instance._loaded_values.get(source, message['car'][field])
+                for field, source in (('brand', 'brand'), ('model', 'model'), ('price', 'price'), ('user', 'user_id'))
+            }
+        if action.value != 'delete':
+            message['changes'] = instance.get_changed_fields()
+        return message
+
+    @cars_activity.groups_for_signal
+    def cars_activity(self, instance: CarModel, **kwargs):
+        yield 'cars'
+        yield f'cars-brand-{instance.brand}'
+        yield f'cars-brand-{instance.brand}-model-{instance.model}'
+        yield f'cars-user-{instance.user_id}'
+
+    @cars_activity.groups_for_consumer
+    def cars_activity(self, brand=None, model=None, user=None, **kwargs):
+        if user is not None:
+            yield f'cars-user-{user}'
+        elif brand and model:
+            yield f'cars-brand-{brand}-model-{model}'
+        elif brand:
+            yield f'cars-brand-{brand}'
+        else:
+            yield 'cars'
 
     @action()
-    async def subscribe_to_cars_activity(self, request_id, **kwargs):
-        await self.cars_activity.subscribe(request_id=request_id)
\ No newline at end of file
+    async def subscribe_to_cars_activity(
+            self, request_id, brand=None, model=None, price_gte=None, price_lte=None, user=None, **kwargs
+    ):
+        serializer = CarActivityFilterSerializer(data={
+            'brand': brand,
+            'model': model,
+            'price_gte': price_gte,
+            'price_lte': price_lte,
+            'user': user,
+        })
+        serializer.is_valid(raise_exception=True)
+        filters = {**dict.fromkeys(serializer.fields), **serializer.validated_data}
+        self.car_filters[request_id] = filters
+        await self.cars_activity.subscribe(
+            request_id=request_id, brand=filters['brand'], model=filters['model'], user=filters['user']
+        )
@@ -0,0 +1,19 @@
+from django_filters import rest_framework as filters
+
+
+class CarFilter(filters.FilterSet):
+    brand = filters.CharFilter('brand', 'exact')
+    model = filters.CharFilter('model', 'exact')
+    price_gte = filters.NumberFilter('price', 'gte')
+    price_lte = filters.NumberFilter('price', 'lte')
+    year_gte = filters.NumberFilter('year', 'gte')
+    year_lte = filters.NumberFilter('year', 'lte')
+    user = filters.NumberFilter('user_id', 'exact')
+
+    order = filters.OrderingFilter(
+        fields=(
+            'price',
+            'year',
+            'created_at',
+        )
+    )
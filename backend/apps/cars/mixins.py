@@ -1,3 +1,5 @@
+from django.conf import settings
+from django.core.cache import cache
 from django.http import Http404
 
 from rest_framework import serializers, status
@@ -5,6 +7,8 @@ from rest_framework.generics import GenericAPIView
 from rest_framework.permissions import IsAdminUser
 from rest_framework.response import Response
 
+from core.services.car_catalogue_service import CarCatalogueService
+
 from apps.cars.models import BrandCarModel
 
 
@@ -35,14 +39,27 @@ class MixinListAddNameCar(BaseMixinCarName):
             raise serializers.ValidationError("Brand with this name already exists.")
         return self.__validate_serializer()
 
+    def __get_brands_data(self, version):
+        key = CarCatalogueService.cache_key('brands', version)
+        data = cache.get(key)
+        if data is None:
+            items = BrandCarModel.objects.prefetch_related('model')
+            data = self.serializer_class(items, many=True).data
+            cache.set(key, data, settings.CAR_CATALOGUE_CACHE_TTL)
+        return data
+
     def get(self, request, id=None, *args, **kwargs):
-        if id is None:
-            items = BrandCarModel.objects.all()
+        brand = None if id is None else self.__get_brand_or_404(id)
+        version = CarCatalogueService.get_version()
+        etag = f'"{version}"'
+        if request.headers.get('If-None-Match') == etag:
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers={'ETag': etag})
+        if brand is None:
+            data = self.__get_brands_data(version)
         else:
-            brand = self.__get_brand_or_404(id)
             items = self.model_class.objects.filter(brand=brand)
-        serializer = self.serializer_class(items, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+            data = self.serializer_class(items, many=True).data
+        return Response(data, status=status.HTTP_200_OK, headers={'ETag': etag})
 
     def post(self, request, id=None, *args, **kwargs):
         if id is None:
@@ -55,6 +72,7 @@ class MixinListAddNameCar(BaseMixinCarName):
                 return Response("This model with this name already exists.", status=status.HTTP_400_BAD_REQUEST)
             serializer = self.__validate_serializer()
             serializer.save(brand=brand_name)
+        CarCatalogueService.bump_version()
         return Response(serializer.data, status=status.HTTP_201_CREATED)
 
 
@@ -74,10 +92,12 @@ class MixinUpdateNameCar(BaseMixinCarName):
         serializer = self.serializer_class(instance, data=request.data, partial=True)
         serializer.is_valid(raise_exception=True)
         serializer.save()
+        CarCatalogueService.bump_version()
         return Response(serializer.data, status=status.HTTP_200_OK)
 
     def delete(self, request, id, *args, **kwargs):
         model_class = self.model_class
         instance = self.__get_object(id, model_class)
         instance.delete()
+        CarCatalogueService.bump_version()
         return Response(status=status.HTTP_204_NO_CONTENT)
@@ -6,6 +6,7 @@ from django.db import models
 
 from core.enums.regex_enum import RegExEnum
 from core.models import BaseModel
+from core.services.content_storage import content_storage
 from core.services.upload_images_service import upload_photo_car
 
 from apps.users.models import UserModel as User
@@ -35,11 +36,43 @@ class CarModel(BaseModel):
     user = models.ForeignKey(User, on_delete=models.PROTECT, related_name='cars', null=True)
     objects = models.Manager()
     my_object = CarManager()
-    photo_car = models.ImageField(upload_to=upload_photo_car, blank=True)
+    photo_car = models.ImageField(upload_to=upload_photo_car, storage=content_storage, blank=True)
+    photo_car_variants = models.JSONField(default=dict, blank=True)
+    TRACKED_FIELDS = ('brand', 'model', 'price', 'year', 'content', 'photo_car', 'user_id')
 
     class Meta:
         db_table = 'cars'
         ordering = ('id',)
+        indexes = (
+            models.Index(fields=('brand', 'model')),
+            models.Index(fields=('price',)),
+            models.Index(fields=('year',)),
+            models.Index(fields=('created_at', 'id')),
+        )
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_values = instance.get_tracked_values()
+        return instance
+
+    def get_tracked_values(self) -> dict:
+        deferred = self.get_deferred_fields()
+        values = {field: getattr(self, field) for field in self.TRACKED_FIELDS if field not in deferred}
+        if 'photo_car' in values:
+            values['photo_car'] = values['photo_car'].name or ''
+        return values
+
+    def get_changed_fields(self) -> dict:
+        loaded_values = getattr(self, '_loaded_values', {})
+        return {
+            field: value for field, value in self.get_tracked_values().items()
+            if field not in loaded_values or loaded_values[field] != value
+        }
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        self._loaded_values = self.get_tracked_values()
 
 
 class BrandCarModel(models.Model):
@@ -70,3 +103,14 @@ class CountViewCarModel(models.Model):
     class Meta:
         db_table = 'count_view_car'
         ordering = ('id', 'count_view')
+        constraints = (
+            models.UniqueConstraint(fields=('car',), name='count_view_car_unique_car'),
+        )
+
+
+class BadWordModel(models.Model):
+    word = models.CharField(max_length=50, unique=True)
+
+    class Meta:
+        db_table = 'bad_words'
+        ordering = ('id',)
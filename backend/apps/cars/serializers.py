@@ -1,13 +1,17 @@
 from django.contrib.auth import get_user_model
-from django.db.models import F
 
 from rest_framework import serializers
 from rest_framework.response import Response
 
+from core.enums.regex_enum import RegExEnum
+from core.fields.header_image_field import HeaderImageField
+from core.services.car_catalogue_service import CarCatalogueService
+from core.services.image_service import ImageService
+from core.services.moderation_service import ModerationService
+
 from apps.users.models import CountModel
 from apps.users.models import UserModel as User
 
-from ..users.validators import UserValidator
 from .models import BrandCarModel, CarModel, ModelCarModel
 from .validators import CarValidator
 
@@ -21,22 +25,26 @@ class CountValidateSerializer(serializers.ModelSerializer):
 
 
 class CarSerializer(serializers.ModelSerializer):
+    photo_car_variants = serializers.SerializerMethodField()
+
+    @staticmethod
+    def get_photo_car_variants(car: CarModel):
+        return ImageService.get_variant_urls(car.photo_car, car.photo_car_variants)
+
     @staticmethod
     def __validate_name_car(brand, model):
         msg_call = "Please contact the site manager."
-        try:
-            car_brand = BrandCarModel.objects.get(brand_name=brand)
-            car_model = ModelCarModel.objects.get(model_name=model)
-            if car_model.brand_id == car_brand.id:
-                return car_brand.brand_name
-            raise serializers.ValidationError(
-                f'This model of the car does not exist in the brand. {msg_call}')
-        except BrandCarModel.DoesNotExist:
+        car_brand = CarCatalogueService.get_brands().get(brand)
+        if car_brand is None:
             raise serializers.ValidationError(
                 f'This brand of the car does not exist in the database. {msg_call}')
-        except ModelCarModel.DoesNotExist:
+        if model in car_brand['models']:
+            return brand
+        if CarCatalogueService.has_model(model):
             raise serializers.ValidationError(
-                f'This model of the brand on the car does not exist in the database. {msg_call}')
+                f'This model of the car does not exist in the brand. {msg_call}')
+        raise serializers.ValidationError(
+            f'This model of the brand on the car does not exist in the database. {msg_call}')
 
     @staticmethod
     def validate_and_save_car(car, data, partial=False):
@@ -69,32 +77,34 @@ class CarSerializer(serializers.ModelSerializer):
             serializer.is_valid(raise_exception=True)
         except serializers.ValidationError as e:
             errors = e.detail
-            if errors['content'][0] == CarValidator.msg_bad_words:
-                content_count, created = CountModel.objects.get_or_create(user_id=user_id, defaults={"count": 0})
-                if not created:
-                    content_count.count = F('count') + 1
-                    content_count.save()
-                count_content = CountModel.objects.filter(user_id=user_id)
-                if count_content[0].count > 2:
-                    UserValidator.validate_content_user(user_id)
-                    content_count.delete()
+            if CarValidator.msg_bad_words in errors.get('content', []):
+                ModerationService.add_strike(user_id)
             raise e
         return serializer
 
     class Meta:
         model = CarModel
-        fields = ('id', 'photo_car', 'brand', 'model', 'price', 'year', 'content', 'created_at', 'updated_at', 'user')
+        fields = (
+            'id',
+            'photo_car',
+            'photo_car_variants',
+            'brand',
+            'model',
+            'price',
+            'year',
+            'content',
+            'created_at',
+            'updated_at',
+            'user',
+        )
 
 
 class CarPhotoSerializer(serializers.ModelSerializer):
+    photo_car = HeaderImageField()
+
     class Meta:
         model = CarModel
         fields = ('photo_car',)
-        extra_kwargs = {
-            'photo_car': {
-                'required': True
-            }
-        }
 
 
 class ModelCarSerializer(serializers.ModelSerializer):
@@ -109,3 +119,11 @@ class BrandCarSerializer(serializers.ModelSerializer):
     class Meta:
         model = BrandCarModel
         fields = ('id', 'brand_name', 'model')
+
+
+class CarActivityFilterSerializer(serializers.Serializer):
+    brand = serializers.RegexField(RegExEnum.BRAND.pattern, required=False, allow_null=True)
+    model = serializers.RegexField(RegExEnum.MODEL.pattern, required=False, allow_null=True)
+    price_gte = serializers.IntegerField(min_value=0, required=False, allow_null=True)
+    price_lte = serializers.IntegerField(min_value=0, required=False, allow_null=True)
+    user = serializers.IntegerField(min_value=1, required=False, allow_null=True)
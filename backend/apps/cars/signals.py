@@ -0,0 +1,25 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from core.services.cache_version_service import CacheVersionService
+from core.services.car_cache_service import CarCacheService
+from core.services.image_service import ImageService
+
+from .models import BadWordModel, CarModel
+from .validators import CarValidator
+
+
+@receiver((post_save, post_delete), sender=CarModel)
+def invalidate_car_cache(sender, instance: CarModel, **kwargs):
+    CarCacheService.invalidate(instance.pk, instance.user_id)
+
+
+@receiver(post_delete, sender=CarModel)
+def release_car_photo(sender, instance: CarModel, **kwargs):
+    ImageService.delete_variants(instance.photo_car, instance.photo_car_variants)
+    instance.photo_car.delete(save=False)
+
+
+@receiver((post_save, post_delete), sender=BadWordModel)
+def rebuild_bad_words_matcher(sender, **kwargs):
+    CacheVersionService.bump_version(CarValidator.VERSION_KEY)
@@ -0,0 +1,125 @@
+import os
+import shutil
+import tempfile
+import tracemalloc
+import warnings
+from io import BytesIO
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from asgiref.sync import async_to_sync
+from djangochannelsrestframework.observer.model_observer import Action
+from PIL import Image
+
+from apps.cars.consumers import CarConsumer
+from apps.cars.models import CarModel
+from apps.cars.views import CarAddPhotoView
+from apps.users.models import ProfileModel, UserModel
+
+
+class CarsActivityTestCase(TestCase):
+    def setUp(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            car = CarModel.objects.create(brand='Audi', model='A4', price=1000, year=2010, content='Car')
+        self.car = CarModel.objects.get(pk=car.pk)
+        self.consumer = CarConsumer()
+
+    def subscribe(self, **filters):
+        self.consumer.car_filters['request'] = {
+            **dict.fromkeys(('brand', 'model', 'price_gte', 'price_lte', 'user')), **filters
+        }
+        self.group = next(CarConsumer.cars_activity.group_names_for_consumer(
+            self.consumer, brand=filters.get('brand'), model=filters.get('model'), user=filters.get('user')
+        ))
+
+    def update(self, **fields):
+        for field, value in fields.items():
+            setattr(self.car, field, value)
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            messages = list(CarConsumer.cars_activity.prepare_messages(self.car, Action.UPDATE))
+        self.car._loaded_values = self.car.get_tracked_values()
+        for message in messages:
+            if message['group'] == self.group:
+                async_to_sync(CarConsumer.cars_activity.func)(
+                    self.consumer, message['body'], action=message['action'], subscribing_request_ids=['request']
+                )
+
+    @property
+    def queued(self):
+        return [(action, message) for action, message, _ in self.consumer.outbox.values()]
+
+    def test_car_leaving_brand_group_is_deleted(self):
+        self.subscribe(brand='Audi')
+        self.update(brand='Bmw')
+        self.assertEqual(self.queued, [('delete', {'id': self.car.pk})])
+
+    def test_car_entering_brand_group_is_sent_in_full(self):
+        self.subscribe(brand='Bmw')
+        self.update(brand='Bmw')
+        self.assertEqual(self.queued, [('create', {'id': self.car.pk, 'car': self.car.get_tracked_values()})])
+
+    def test_car_moving_into_price_range_is_sent_in_full(self):
+        self.subscribe(price_gte=2000)
+        self.update(price=3000)
+        self.assertEqual(self.queued, [('create', {'id': self.car.pk, 'car': self.car.get_tracked_values()})])
+
+    def test_car_leaving_and_reentering_price_range_in_one_window_is_created(self):
+        self.subscribe(price_lte=2000)
+        self.update(price=3000)
+        self.update(price=1500)
+        self.assertEqual(self.queued, [('create', {'id': self.car.pk, 'car': self.car.get_tracked_values()})])
+
+    def test_update_within_filter_sends_only_changes(self):
+        self.subscribe(brand='Audi')
+        self.update(year=2012)
+        self.update(price=1200)
+        self.assertEqual(self.queued, [('update', {'id': self.car.pk, 'changes': {'year': 2012, 'price': 1200}})])
+
+
+class CarAddPhotoMemoryTestCase(TestCase):
+    UPLOAD_SIZE = 20 * 1024 * 1024
+    MAX_PEAK_MEMORY = 4 * 1024 * 1024
+
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        settings_override = override_settings(MEDIA_ROOT=media_root)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        profile = ProfileModel.objects.create(name='Name', surname='Surname', age=20, location='Kyiv')
+        self.user = UserModel.objects.create_user('user@gmail.com', 'Password1!', profile=profile)
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            self.car = CarModel.objects.create(
+                brand='Audi', model='A4', price=1000, year=2010, content='Car', user=self.user
+            )
+
+    def make_photo(self) -> bytes:
+        side = int((self.UPLOAD_SIZE / 3) ** 0.5) + 1
+        buffer = BytesIO()
+        Image.frombytes('RGB', (side, side), os.urandom(side * side * 3)).save(buffer, 'PNG', compress_level=0)
+        return buffer.getvalue()
+
+    def test_20mb_upload_peak_memory_is_bounded(self):
+        photo = self.make_photo()
+        self.assertGreaterEqual(len(photo), self.UPLOAD_SIZE)
+        request = APIRequestFactory().put(
+            '/', {'photo_car': SimpleUploadedFile('car.png', photo, 'image/png')}, format='multipart'
+        )
+        force_authenticate(request, self.user)
+        del photo
+        tracemalloc.start()
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore')
+                response = CarAddPhotoView.as_view()(request, user_id=self.user.pk, car_id=self.car.pk)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        self.assertEqual(response.status_code, 200, response.data)
+        self.assertLess(peak, self.MAX_PEAK_MEMORY)
@@ -6,7 +6,9 @@ from .views import (
     BrandUpdateDestroyView,
     CarAddPhotoView,
     CarByIdView,
+    CarCacheStatsView,
     CarCreateView,
+    CarFeedStatsView,
     CarListView,
     CarUpdateDestroyView,
     ModelListAdd,
@@ -17,6 +19,8 @@ urlpatterns = [
     path('', AllCarsListView.as_view(), name='car_list'),
     path('/<int:user_id>/car_photo/<int:car_id>', CarAddPhotoView.as_view(), name='car_add_photo'),
     path('/car/<int:id>', CarByIdView.as_view(), name='car_by_id'),
+    path('/cache_stats', CarCacheStatsView.as_view(), name='car_cache_stats'),
+    path('/feed_stats', CarFeedStatsView.as_view(), name='car_feed_stats'),
     path('/<int:id>', CarUpdateDestroyView.as_view(), name='car_update_destroy'),
     path('/<int:pk>/user_cars', CarListView.as_view(), name='car_list_user'),
     path('/create_car', CarCreateView.as_view(), name='car_create'),
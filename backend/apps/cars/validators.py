@@ -1,16 +1,67 @@
 import re
 
+from django.conf import settings
+
 from rest_framework.exceptions import ValidationError
 
+from core.services.cache_version_service import CacheVersionService
+
 
 class CarValidator:
     msg_bad_words = 'This content has some bad words!!!'
     bad_words = ['fuck', 'dick', 'shit', 'bitch']
+    VERSION_KEY = 'bad_words_version'
+    _version = None
+    _matcher = None
 
     @staticmethod
-    def validate_content(value):
-        for word in CarValidator.bad_words:
-            if re.search(rf'\b{re.escape(word)}\b', value, re.IGNORECASE):
-                raise ValidationError(CarValidator.msg_bad_words)
+    def __trie_pattern(node: dict) -> str:
+        optional = '' in node
+        branches = [re.escape(char) + CarValidator.__trie_pattern(node[char]) for char in sorted(node) if char]
+        if not branches:
+            return ''
+        if optional:
+            return f'(?:{"|".join(branches)})?'
+        return branches[0] if len(branches) == 1 else f'(?:{"|".join(branches)})'
+
+    @staticmethod
+    def compile_matcher(words) -> re.Pattern | None:
+        trie = {}
+        for word in words:
+            node = trie
+            for char in word.strip().lower():
+                node = node.setdefault(char, {})
+            if node is not trie:
+                node[''] = {}
+        if not trie:
+            return None
+        return re.compile(rf'\b{CarValidator.__trie_pattern(trie)}\b', re.IGNORECASE)
 
+    @staticmethod
+    def load_words() -> set[str]:
+        from .models import BadWordModel
+
+        words = set(CarValidator.bad_words)
+        words_file = getattr(settings, 'BAD_WORDS_FILE', None)
+        if words_file:
+            try:
+                with open(words_file, encoding='utf-8') as file:
+                    words.update(line.strip() for line in file if line.strip())
+            except FileNotFoundError:
+                pass
+        words.update(BadWordModel.objects.values_list('word', flat=True))
+        return words
+
+    @classmethod
+    def get_matcher(cls) -> re.Pattern | None:
+        version = CacheVersionService.get_version(cls.VERSION_KEY)
+        if version != cls._version:
+            cls._matcher = cls.compile_matcher(cls.load_words())
+            cls._version = version
+        return cls._matcher
 
+    @staticmethod
+    def validate_content(value):
+        matcher = CarValidator.get_matcher()
+        if matcher and matcher.search(value):
+            raise ValidationError(CarValidator.msg_bad_words)
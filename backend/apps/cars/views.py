@@ -1,4 +1,5 @@
 from django.contrib.auth import get_user_model
+from django.db import transaction
 from django.http import Http404
 from django.shortcuts import get_object_or_404
 from django.utils.decorators import method_decorator
@@ -6,13 +7,21 @@ from django.utils.decorators import method_decorator
 from rest_framework import status
 from rest_framework.generics import GenericAPIView, UpdateAPIView
 from rest_framework.mixins import ListModelMixin
-from rest_framework.permissions import AllowAny, IsAuthenticated
+from rest_framework.permissions import AllowAny, IsAdminUser, IsAuthenticated
 from rest_framework.response import Response
 
 from drf_yasg.utils import swagger_auto_schema
 
+from core.pagination import CursorPagePagination, PagePagination
+from core.services.car_cache_service import CarCacheService
+from core.services.car_view_service import CarViewService
+from core.services.content_storage import content_storage
+from core.services.image_service import ImageService
+from core.services.socket_metrics_service import SocketMetricsService
+
 from apps.users.models import UserModel as User
 
+from .filters import CarFilter
 from .mixins import MixinListAddNameCar, MixinUpdateNameCar
 from .models import BrandCarModel, CarModel, ModelCarModel
 from .serializers import BrandCarSerializer, CarPhotoSerializer, CarSerializer, ModelCarSerializer
@@ -24,11 +33,22 @@ UserModel: User = get_user_model()
 class AllCarsListView(GenericAPIView, ListModelMixin):
     """
         Get all cars
+        (?paginate=cursor switches to keyset pagination, ?count=true adds total_items to it)
     """
     queryset = CarModel.objects.all()
     serializer_class = CarSerializer
+    filterset_class = CarFilter
     permission_classes = (AllowAny,)
 
+    @property
+    def paginator(self):
+        if not hasattr(self, '_paginator'):
+            if self.request.query_params.get('paginate') == 'cursor':
+                self._paginator = CursorPagePagination()
+            else:
+                self._paginator = PagePagination()
+        return self._paginator
+
     def get(self, request, *args, **kwargs):
         return super().list(request, *args, **kwargs)
 
@@ -44,11 +64,15 @@ class CarListView(GenericAPIView):
 
     def get(self, *args, **kwargs):
         pk = kwargs['pk']
+        data = CarCacheService.get_or_set(CarCacheService.user_cars_key(pk), lambda: self.__get_cars_data(pk))
+        return Response(data, status.HTTP_200_OK)
+
+    @staticmethod
+    def __get_cars_data(pk):
         if not UserModel.objects.filter(pk=pk).exists():
             raise Http404()
         cars = CarModel.objects.filter(user_id=pk)
-        serializer = CarSerializer(cars, many=True)
-        return Response(serializer.data, status.HTTP_200_OK)
+        return CarSerializer(cars, many=True).data
 
 
 @method_decorator(name='get', decorator=swagger_auto_schema(security=[]))
@@ -60,9 +84,39 @@ class CarByIdView(GenericAPIView):
     permission_classes = (AllowAny,)
 
     def get(self, *args, **kwargs):
-        car = get_object_or_404(CarModel, pk=kwargs['id'])
-        serializer = CarSerializer(car)
-        return Response(serializer.data, status.HTTP_200_OK)
+        pk = kwargs['id']
+        data = CarCacheService.get_or_set(
+            CarCacheService.car_key(pk), lambda: CarSerializer(get_object_or_404(CarModel, pk=pk)).data
+        )
+        CarViewService.add_view(pk)
+        return Response(data, status.HTTP_200_OK)
+
+
+class CarCacheStatsView(GenericAPIView):
+    """
+        Get hit/miss counters of the car cache
+    """
+    permission_classes = (IsAdminUser,)
+
+    def get(self, *args, **kwargs):
+        return Response(CarCacheService.get_stats(), status.HTTP_200_OK)
+
+
+class CarFeedStatsView(GenericAPIView):
+    """
+        Get delivery counters, average send lag and queue depth of the cars websocket feed
+    """
+    permission_classes = (IsAdminUser,)
+
+    def get(self, *args, **kwargs):
+        counters = SocketMetricsService.get_counters('cars')
+        sent = counters.get('sent', 0)
+        send_lag_avg_ms = round(counters.get('send_lag_us', 0) / sent / 1000, 3) if sent else 0
+        return Response({
+            **counters,
+            'send_lag_avg_ms': send_lag_avg_ms,
+            **SocketMetricsService.get_gauges('cars'),
+        }, status.HTTP_200_OK)
 
 
 class CarCreateView(GenericAPIView):
@@ -93,11 +147,17 @@ class CarAddPhotoView(UpdateAPIView):
     http_method_names = ('put',)
 
     def get_object(self):
-        return CarModel.my_object.all_with_cars().get(pk=self.kwargs['car_id'])
+        return CarModel.objects.get(pk=self.kwargs['car_id'])
 
+    @transaction.atomic
     def perform_update(self, serializer):
-        self.get_object().photo_car.delete()
-        super().perform_update(serializer)
+        car: CarModel = serializer.instance
+        if content_storage.is_same_content(car.photo_car, serializer.validated_data['photo_car']):
+            return
+        ImageService.delete_variants(car.photo_car, car.photo_car_variants)
+        car.photo_car.delete(save=False)
+        car = serializer.save(photo_car_variants={})
+        transaction.on_commit(lambda: ImageService.create_car_photo_variants.delay(car.pk, car.photo_car.name))
 
 
 class CarUpdateDestroyView(GenericAPIView):
@@ -1,67 +1,125 @@
+import time
+
+from django.conf import settings
+
 from channels.db import database_sync_to_async
 from djangochannelsrestframework.decorators import action
 from djangochannelsrestframework.generics import GenericAsyncAPIConsumer
 
+from core.services.chat_buffer_service import chat_message_buffer
+from core.services.chat_presence_service import ChatPresenceService
+from core.services.chat_replay_service import ChatReplayService
+from core.services.socket_metrics_service import SocketMetricsService
+
 from .models import ChatModel
+from .serializers import ChatHistoryQuerySerializer
 
 
 class ChatConsumer(GenericAsyncAPIConsumer):
+    HISTORY_PAGE_SIZE = 20
+    HISTORY_MAX_PAGE_SIZE = 50
+
     def __init__(self, *args, **kwargs):
         self.name = None
         self.room_name = None
+        self.presence_touched_at = 0.0
+        self.metrics = {'messages_in': 0, 'messages_out': 0, 'group_sends': 0, 'send_latency_us': 0}
         super().__init__(*args, **kwargs)
 
     async def connect(self):
         if not self.scope['user']:
             await self.close()
+            return
         await self.accept()
         self.room_name = self.scope['url_route']['kwargs']['room']
         await self.channel_layer.group_add(
             self.room_name,
             self.channel_name
         )
-        self.name = await self.get_profile_surname()
-        await self.channel_layer.group_send(
-            self.room_name,
-            {
+        self.name = self.scope['user'].name
+        await self.refresh_presence()
+        await self.send_to_room({
+            'type': 'sender',
+            'message': f'{self.name} connected to chat'
+        })
+        messages = await ChatReplayService.get(self.room_name)
+        if not messages:
+            await chat_message_buffer.flush()
+            messages = [
+                {'message': item['message'], 'user': item['owner']}
+                for item in await self.get_messages(limit=settings.CHAT_REPLAY_DEPTH)
+            ]
+            await ChatReplayService.fill(self.room_name, messages)
+        await self.sender({'messages': list(reversed(messages))})
+
+    async def disconnect(self, code):
+        await chat_message_buffer.flush()
+        if self.room_name:
+            await self.channel_layer.group_discard(self.room_name, self.channel_name)
+            await ChatPresenceService.leave(self.room_name, self.channel_name)
+            await self.send_to_room({
                 'type': 'sender',
-                'message': f'{self.name} connected to chat'
-            }
-        )
-        messages = await self.get_last_five_messages()
-        for item in reversed(messages):
-            await self.sender({
-                'message': item['message'],
-                'user': item['owner']
+                'message': f'{self.name} disconnected from chat'
             })
+            await self.flush_metrics()
+        await super().disconnect(code)
+
+    async def send_to_room(self, event):
+        started = time.perf_counter()
+        await self.channel_layer.group_send(self.room_name, event)
+        self.metrics['group_sends'] += 1
+        self.metrics['send_latency_us'] += int((time.perf_counter() - started) * 1_000_000)
+
+    async def flush_metrics(self):
+        await SocketMetricsService.incr('chat', **self.metrics)
+        self.metrics = dict.fromkeys(self.metrics, 0)
+
+    async def refresh_presence(self) -> int:
+        online = await ChatPresenceService.touch(self.room_name, self.channel_name)
+        self.presence_touched_at = time.monotonic()
+        await self.flush_metrics()
+        return online
 
     async def sender(self, event):
+        self.metrics['messages_out'] += 1
         await self.send_json(event)
 
     @action()
-    async def send_message(self, data, request_id, action):
-        await self.channel_layer.group_send(
-            self.room_name,
-            {
-                'type': 'sender',
-                'message': data,
-                'user': self.name,
-                'id': request_id,
-            }
-        )
-        await self.save_message_to_db(data, self.scope['user'])
+    async def heartbeat(self, request_id, **kwargs):
+        online = await self.refresh_presence()
+        await self.reply(data={'online': online}, action='heartbeat', request_id=request_id)
 
-    @database_sync_to_async
-    def get_profile_surname(self):
-        return self.scope['user'].profile.surname
+    @action()
+    async def send_message(self, data, request_id, action):
+        self.metrics['messages_in'] += 1
+        await self.send_to_room({
+            'type': 'sender',
+            'message': data,
+            'user': self.name,
+            'id': request_id,
+        })
+        await chat_message_buffer.add(self.room_name, data, self.scope['user'].pk)
+        await ChatReplayService.push(self.room_name, {'message': data, 'user': self.name})
+        if time.monotonic() - self.presence_touched_at >= settings.CHAT_PRESENCE_TTL / 4:
+            await self.refresh_presence()
 
-    @database_sync_to_async
-    def save_message_to_db(self, message, user):
-        ChatModel.objects.create(message=message, owner=user)
+    @action()
+    async def history(self, request_id, before_id=None, limit=HISTORY_PAGE_SIZE, **kwargs):
+        serializer = ChatHistoryQuerySerializer(data={'before_id': before_id, 'limit': limit})
+        serializer.is_valid(raise_exception=True)
+        before_id = serializer.validated_data.get('before_id')
+        limit = max(1, min(serializer.validated_data.get('limit', self.HISTORY_PAGE_SIZE), self.HISTORY_MAX_PAGE_SIZE))
+        await chat_message_buffer.flush()
+        messages = await self.get_messages(before_id, limit)
+        await self.reply(
+            data={'messages': messages, 'next': messages[-1]['id'] if messages else None},
+            action='history',
+            request_id=request_id
+        )
 
     @database_sync_to_async
-    def get_last_five_messages(self):
+    def get_messages(self, before_id=None, limit=HISTORY_PAGE_SIZE):
         return [
-            {'message': item.message, 'owner': item.owner.profile.surname}
-            for item in ChatModel.objects.order_by('-id')[:5]
+            {'id': item.id, 'message': item.message, 'owner': item.owner.profile.surname}
+            for item in ChatModel.objects.get_history(self.room_name, before_id)[:limit]
         ]
@@ -0,0 +1,9 @@
+from django.db import models
+
+
+class ChatManager(models.Manager):
+    def get_history(self, room, before_id=None):
+        queryset = self.filter(room=room).select_related('owner__profile').order_by('-id')
+        if before_id is not None:
+            queryset = queryset.filter(id__lt=before_id)
+        return queryset
@@ -3,12 +3,19 @@ from django.db import models
 
 from apps.users.models import UserModel as User
 
+from .managers import ChatManager
+
 UserModel: User = get_user_model()
 
 
 class ChatModel(models.Model):
+    room = models.CharField(max_length=100)
     message = models.CharField(max_length=255)
     owner = models.ForeignKey(UserModel, on_delete=models.CASCADE)
+    objects = ChatManager()
 
     class Meta:
         db_table = 'chat'
+        indexes = (
+            models.Index(fields=('room', 'id')),
+        )
@@ -0,0 +1,16 @@
+from rest_framework import serializers
+
+from .models import ChatModel
+
+
+class ChatSerializer(serializers.ModelSerializer):
+    owner = serializers.CharField(source='owner.profile.surname', read_only=True)
+
+    class Meta:
+        model = ChatModel
+        fields = ('id', 'message', 'owner')
+
+
+class ChatHistoryQuerySerializer(serializers.Serializer):
+    before_id = serializers.IntegerField(min_value=1, required=False, allow_null=True)
+    limit = serializers.IntegerField(required=False)
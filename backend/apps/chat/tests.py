@@ -0,0 +1,63 @@
+import asyncio
+from unittest.mock import patch
+
+from django.db import OperationalError
+from django.test import TransactionTestCase
+
+from asgiref.sync import async_to_sync
+
+from core.services.chat_buffer_service import ChatMessageBuffer
+
+from apps.chat.models import ChatModel
+from apps.users.models import ProfileModel, UserModel
+
+
+class ChatMessageBufferTestCase(TransactionTestCase):
+    def setUp(self):
+        profile = ProfileModel.objects.create(name='Name', surname='Surname', age=20, location='Kyiv')
+        self.user = UserModel.objects.create_user('user@gmail.com', 'Password1!', profile=profile)
+        self.buffer = ChatMessageBuffer(max_size=100, flush_interval=60)
+
+    def add_messages(self, count):
+        async def add():
+            for index in range(count):
+                await self.buffer.add('room', f'message {index}', self.user.pk)
+        async_to_sync(add)()
+
+    def test_clean_shutdown_persists_every_acknowledged_message(self):
+        self.add_messages(3)
+        self.assertFalse(ChatModel.objects.exists())
+        self.buffer.flush_sync()
+        self.assertEqual(
+            list(ChatModel.objects.order_by('id').values_list('message', flat=True)),
+            ['message 0', 'message 1', 'message 2']
+        )
+
+    def test_cancelled_flush_keeps_messages_for_shutdown(self):
+        self.add_messages(3)
+        with patch.object(ChatModel.objects, 'bulk_create', side_effect=asyncio.CancelledError):
+            with self.assertRaises(asyncio.CancelledError):
+                async_to_sync(self.buffer.flush)()
+        self.buffer.flush_sync()
+        self.assertEqual(ChatModel.objects.count(), 3)
+
+    def test_failed_flush_is_retried_without_new_messages(self):
+        self.buffer.flush_interval = 0.01
+        bulk_create = ChatModel.objects.bulk_create
+        calls = []
+
+        def fail_once(messages):
+            calls.append(len(messages))
+            if len(calls) == 1:
+                raise OperationalError('Database is unavailable')
+            return bulk_create(messages)
+
+        async def add_and_wait():
+            await self.buffer.add('room', 'message', self.user.pk)
+            await asyncio.sleep(0.2)
+
+        with patch.object(ChatModel.objects, 'bulk_create', side_effect=fail_once):
+            with self.assertLogs('core.services.chat_buffer_service', 'ERROR'):
+                async_to_sync(add_and_wait)()
+        self.assertEqual(calls, [1, 1])
+        self.assertEqual(ChatModel.objects.count(), 1)
@@ -0,0 +1,8 @@
+from django.urls import path
+
+from .views import ChatHistoryView, ChatStatsView
+
+urlpatterns = [
+    path('/stats', ChatStatsView.as_view(), name='chat_stats'),
+    path('/<str:room>/history', ChatHistoryView.as_view(), name='chat_history'),
+]
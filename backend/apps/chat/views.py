@@ -1,3 +1,41 @@
-from django.shortcuts import render
+from rest_framework import status
+from rest_framework.generics import GenericAPIView, ListAPIView
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
 
-# Create your views here.
+from core.pagination import ChatCursorPagination
+from core.services.chat_presence_service import ChatPresenceService
+from core.services.socket_metrics_service import SocketMetricsService
+
+from .models import ChatModel
+from .serializers import ChatSerializer
+
+
+class ChatHistoryView(ListAPIView):
+    """
+        Get messages of the chat room, newest first
+    """
+    serializer_class = ChatSerializer
+    pagination_class = ChatCursorPagination
+
+    def get_queryset(self):
+        return ChatModel.objects.get_history(self.kwargs['room'])
+
+
+class ChatStatsView(GenericAPIView):
+    """
+        Get message counters, send latency and online connections by room
+    """
+    permission_classes = (IsAdminUser,)
+
+    def get(self, *args, **kwargs):
+        counters = SocketMetricsService.get_counters('chat')
+        group_sends = counters.get('group_sends', 0)
+        latency_avg_ms = round(counters.get('send_latency_us', 0) / group_sends / 1000, 3) if group_sends else 0
+        rooms = ChatPresenceService.get_rooms()
+        return Response({
+            **counters,
+            'send_latency_avg_ms': latency_avg_ms,
+            'connections': sum(rooms.values()),
+            'rooms': rooms,
+        }, status.HTTP_200_OK)
@@ -1,4 +1,5 @@
 from django.contrib.auth.base_user import BaseUserManager
+from django.db import connection, models
 
 
 class UserManager(BaseUserManager):
@@ -26,3 +27,16 @@ class UserManager(BaseUserManager):
 
     def all_with_profiles(self):
         return self.select_related('profile')
+
+    def all_with_profiles_and_cars(self):
+        return self.all_with_profiles().prefetch_related('cars')
+
+
+class CountManager(models.Manager):
+    def add_strike(self, user_id):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'INSERT INTO {self.model._meta.db_table} (user_id, count) VALUES (%s, 1) '
+                f'ON DUPLICATE KEY UPDATE count = count + 1',
+                [user_id]
+            )
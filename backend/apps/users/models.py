@@ -4,9 +4,10 @@ from django.db import models
 
 from core.enums.regex_enum import RegExEnum
 from core.models import BaseModel
+from core.services.content_storage import content_storage
 from core.services.upload_images_service import upload_avatar
 
-from .managers import UserManager
+from .managers import CountManager, UserManager
 
 
 class ProfileModel(BaseModel):
@@ -20,7 +21,8 @@ class ProfileModel(BaseModel):
         validators.MinValueValidator(16),
         validators.MaxValueValidator(150)
     ))
-    avatar = models.ImageField(upload_to=upload_avatar, blank=True)
+    avatar = models.ImageField(upload_to=upload_avatar, storage=content_storage, blank=True)
+    avatar_variants = models.JSONField(default=dict, blank=True)
     location = models.CharField(max_length=30, validators=(
         validators.RegexValidator(RegExEnum.NAME.pattern, RegExEnum.NAME.msg),
     ))
@@ -63,7 +65,11 @@ class CityModel(models.Model):
 class CountModel(models.Model):
     count = models.PositiveIntegerField(default=0)
     user = models.ForeignKey(UserModel, on_delete=models.CASCADE, related_name='count', null=True)
+    objects = CountManager()
 
     class Meta:
         db_table = 'count_validate'
         ordering = ('id', 'count')
+        constraints = (
+            models.UniqueConstraint(fields=('user',), name='count_validate_unique_user'),
+        )
@@ -3,7 +3,9 @@ from django.db import transaction
 
 from rest_framework import serializers
 
+from core.fields.header_image_field import HeaderImageField
 from core.services.email_service import EmailService
+from core.services.image_service import ImageService
 
 from ..cars.serializers import CarSerializer
 from .models import CityModel, CountModel, ProfileModel
@@ -13,6 +15,12 @@ UserModel: User = get_user_model()
 
 
 class ProfileSerializer(serializers.ModelSerializer):
+    avatar_variants = serializers.SerializerMethodField()
+
+    @staticmethod
+    def get_avatar_variants(profile: ProfileModel):
+        return ImageService.get_variant_urls(profile.avatar, profile.avatar_variants)
+
     def validate_location(self, value):
         try:
             city = CityModel.objects.get(name=value)
@@ -23,7 +31,7 @@ class ProfileSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = ProfileModel
-        fields = ('id', 'name', 'surname', 'age', 'location', 'avatar')
+        fields = ('id', 'name', 'surname', 'age', 'location', 'avatar', 'avatar_variants')
 
 
 class UserSerializer(serializers.ModelSerializer):
@@ -73,14 +81,11 @@ class UserSerializer(serializers.ModelSerializer):
 
 
 class AvatarSerializer(serializers.ModelSerializer):
+    avatar = HeaderImageField()
+
     class Meta:
         model = ProfileModel
         fields = ('avatar',)
-        extra_kwargs = {
-            'avatar': {
-                'required': True
-            }
-        }
 
 
 class CitySerializer(serializers.ModelSerializer):
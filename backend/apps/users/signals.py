@@ -0,0 +1,18 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from core.authentication.cached_jwt_authentication import CachedJWTAuthentication
+from core.services.image_service import ImageService
+
+from .models import ProfileModel, UserModel
+
+
+@receiver((post_save, post_delete), sender=UserModel)
+def invalidate_auth_user_cache(sender, instance: UserModel, **kwargs):
+    CachedJWTAuthentication.invalidate(instance.pk)
+
+
+@receiver(post_delete, sender=ProfileModel)
+def release_avatar(sender, instance: ProfileModel, **kwargs):
+    ImageService.delete_variants(instance.avatar, instance.avatar_variants)
+    instance.avatar.delete(save=False)
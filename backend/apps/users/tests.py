@@ -0,0 +1,27 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+
+from apps.cars.models import CarModel
+from apps.users.models import ProfileModel
+from apps.users.models import UserModel as User
+
+UserModel: User = get_user_model()
+
+
+class UserListCreateViewTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        for index in range(6):
+            profile = ProfileModel.objects.create(name='Name', surname='Surname', age=20, location='Kyiv')
+            user = UserModel.objects.create_user(f'user{index}@gmail.com', 'Password1!', profile=profile)
+            for year in (2010, 2015):
+                CarModel.objects.create(brand='Audi', model='A4', price=1000, year=year, content='Car', user=user)
+
+    def test_list_query_count_does_not_depend_on_page_size(self):
+        for size in (2, 5):
+            with self.assertNumQueries(3):
+                response = self.client.get(reverse('user_list_create'), {'size': size})
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(len(response.data['data']), size)
+            self.assertTrue(all(len(user['cars']) == 2 for user in response.data['data']))
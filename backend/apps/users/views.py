@@ -1,4 +1,5 @@
 from django.contrib.auth import get_user_model
+from django.db import transaction
 from django.http import Http404
 from django.utils.decorators import method_decorator
 
@@ -9,7 +10,10 @@ from rest_framework.views import Response
 
 from drf_yasg.utils import swagger_auto_schema
 
-from apps.users.models import CityModel
+from core.services.content_storage import content_storage
+from core.services.image_service import ImageService
+
+from apps.users.models import CityModel, ProfileModel
 from apps.users.models import UserModel as User
 
 from .filters import UserFilter
@@ -28,7 +32,7 @@ class UserListCreateView(ListCreateAPIView):
             Create user.
     """
     serializer_class = UserSerializer
-    queryset = UserModel.objects.all_with_profiles()
+    queryset = UserModel.objects.all_with_profiles_and_cars()
     filterset_class = UserFilter
     permission_classes = (AllowAny,)
 
@@ -43,9 +47,15 @@ class UserAddAvatarView(UpdateAPIView):
     def get_object(self):
         return UserModel.objects.all_with_profiles().get(pk=self.request.user.pk).profile
 
+    @transaction.atomic
     def perform_update(self, serializer):
-        self.get_object().avatar.delete()
-        super().perform_update(serializer)
+        profile: ProfileModel = serializer.instance
+        if content_storage.is_same_content(profile.avatar, serializer.validated_data['avatar']):
+            return
+        ImageService.delete_variants(profile.avatar, profile.avatar_variants)
+        profile.avatar.delete(save=False)
+        profile = serializer.save(avatar_variants={})
+        transaction.on_commit(lambda: ImageService.create_avatar_variants.delay(profile.pk, profile.avatar.name))
 
 
 class CityListAddView(GenericAPIView):
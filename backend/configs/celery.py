@@ -1,4 +1,5 @@
 import os
+from datetime import timedelta
 
 from celery import Celery
 from celery.schedules import crontab
@@ -8,9 +9,28 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'configs.settings')
 app = Celery('configs')
 app.config_from_object('django.conf.settings', namespace='CELERY')
 app.autodiscover_tasks()
+app.conf.imports = (
+    'core.services.car_view_service',
+    'core.services.email_service',
+    'core.services.image_service',
+    'core.services.jwt_service',
+    'core.services.moderation_service',
+)
 app.conf.beat_schedule = {
     "send_spam_every_minutes": {
         "task": "core.services.email_service.spam",
         "schedule": crontab()
+    },
+    "flush_email_outbox": {
+        "task": "core.services.email_service.flush_outbox",
+        "schedule": timedelta(seconds=10)
+    },
+    "prune_expired_tokens_every_hour": {
+        "task": "core.services.jwt_service.prune_expired_tokens",
+        "schedule": crontab(minute=0)
+    },
+    "flush_car_views_every_minute": {
+        "task": "core.services.car_view_service.flush_views",
+        "schedule": crontab()
     }
 }
@@ -0,0 +1,35 @@
+import os
+
+REDIS_URL = os.environ.get('REDIS_URL', 'redis://redis:6379/0')
+REDIS_CACHE_URL = os.environ.get('REDIS_CACHE_URL', 'redis://redis:6379/1')
+USE_REDIS_CACHE = os.environ.get('USE_REDIS_CACHE', 'True') == 'True'
+
+if USE_REDIS_CACHE:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_CACHE_URL,
+            'TIMEOUT': 300,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'okten-auto-ria',
+            'TIMEOUT': 300,
+            'OPTIONS': {
+                'MAX_ENTRIES': 10000,
+            },
+        }
+    }
+
+CAR_CACHE_ALIAS = 'default'
+CAR_CACHE_TTL = 300
+CAR_CACHE_MAX_LIST_SIZE = 100
+CAR_CATALOGUE_CACHE_TTL = 3600
+
+AUTH_USER_CACHE_TTL = 60
+
+DB_CONN_MAX_AGE = int(os.environ.get('DB_CONN_MAX_AGE', 60))
+DB_CONN_HEALTH_CHECKS = True
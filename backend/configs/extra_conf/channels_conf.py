@@ -5,4 +5,15 @@ CHANNEL_LAYERS = {
             "hosts": [("redis", 6379)],
         },
     },
-}
\ No newline at end of file
+}
+
+CHAT_BUFFER_SIZE = 100
+CHAT_BUFFER_FLUSH_INTERVAL = 1.0
+CHAT_REPLAY_DEPTH = 5
+CHAT_REPLAY_TTL = 3600
+
+CAR_FEED_COALESCE_WINDOW = 0.2
+CAR_FEED_QUEUE_LIMIT = 100
+CAR_FEED_OVERFLOW_POLICY = 'drop_oldest'  # or 'disconnect'
+
+CHAT_PRESENCE_TTL = 60
@@ -68,8 +68,13 @@ TEMPLATES = [
     {
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
         'DIRS': [os.path.join(BASE_DIR, 'templates')],
-        'APP_DIRS': True,
         'OPTIONS': {
+            'loaders': [
+                ('django.template.loaders.cached.Loader', [
+                    'django.template.loaders.filesystem.Loader',
+                    'django.template.loaders.app_directories.Loader',
+                ]),
+            ],
             'context_processors': [
                 'django.template.context_processors.debug',
                 'django.template.context_processors.request',
@@ -95,6 +100,8 @@ DATABASES = {
         'PASSWORD': os.environ.get('MYSQL_PASSWORD'),
         'HOST': os.environ.get('MYSQL_HOST'),
         'PORT': os.environ.get('MYSQL_PORT'),
+        'CONN_MAX_AGE': DB_CONN_MAX_AGE,
+        'CONN_HEALTH_CHECKS': DB_CONN_HEALTH_CHECKS,
     }
 }
 
@@ -141,6 +148,16 @@ MEDIA_ROOT = os.path.join(BASE_DIR, 'storage')
 
 MEDIA_URL = '/media/'
 
+FILE_UPLOAD_HANDLERS = [
+    'django.core.files.uploadhandler.TemporaryFileUploadHandler',
+]
+
+IMAGE_UPLOAD_MAX_PIXELS = 40_000_000
+
+IMAGE_UPLOAD_FORMATS = ('JPEG', 'PNG', 'WEBP')
+
+BAD_WORDS_FILE = os.environ.get('BAD_WORDS_FILE', os.path.join(BASE_DIR, 'bad_words.txt'))
+
 LOCALE_PATHS = [
     os.path.join(BASE_DIR, 'locale')
 ]
@@ -0,0 +1,35 @@
+from django.conf import settings
+from django.core.cache import cache
+
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+from core.services.cache_version_service import CacheVersionService
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+        JWTAuthentication that keeps the resolved user in the cache for AUTH_USER_CACHE_TTL seconds
+    """
+
+    @staticmethod
+    def __version_key(user_id) -> str:
+        return f'auth_user_version:{user_id}'
+
+    @classmethod
+    def invalidate(cls, user_id):
+        CacheVersionService.bump_version(cls.__version_key(user_id))
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken('Token contained no recognizable user identification')
+        version = CacheVersionService.get_version(self.__version_key(user_id))
+        key = f'auth_user:{user_id}:{version}'
+        user = cache.get(key)
+        if user is None:
+            user = super().get_user(validated_token)
+            cache.set(key, user, settings.AUTH_USER_CACHE_TTL)
+        return user
@@ -15,3 +15,4 @@ class CarDataClass:
     created_at: datetime
     updated_at: datetime
     user: UserDataClass
+    user_id: int
@@ -0,0 +1,34 @@
+from django.conf import settings
+
+from rest_framework import serializers
+
+from PIL import Image, UnidentifiedImageError
+
+
+class HeaderImageField(serializers.ImageField):
+    """
+        Validates an uploaded image by its header only, without decoding the pixels
+    """
+    default_error_messages = {
+        **serializers.ImageField.default_error_messages,
+        'image_format': 'Unsupported image format. Allowed formats: {formats}.',
+        'image_size': 'The image is too large, max {max_pixels} pixels.',
+    }
+
+    def to_internal_value(self, data):
+        file = serializers.FileField.to_internal_value(self, data)
+        max_pixels = settings.IMAGE_UPLOAD_MAX_PIXELS
+        formats = settings.IMAGE_UPLOAD_FORMATS
+        try:
+            with Image.open(file) as image:
+                width, height = image.size
+                image_format = image.format
+        except (UnidentifiedImageError, Image.DecompressionBombError, OSError):
+            self.fail('invalid_image')
+        finally:
+            file.seek(0)
+        if image_format not in formats:
+            self.fail('image_format', formats=', '.join(formats))
+        if width * height > max_pixels:
+            self.fail('image_size', max_pixels=max_pixels)
+        return file
@@ -0,0 +1,28 @@
+import time
+
+from django.core.management import BaseCommand
+
+from core.services.email_render_service import EmailRenderService
+
+
+class Command(BaseCommand):
+    help = 'Measure renders per second of the precompiled email templates'
+    contexts = {
+        'register.html': {'name': 'Name', 'url': 'http://localhost:3000/activate/token'},
+        'recovery_password.html': {'name': 'Name', 'url': 'http://localhost:3000/recovery/token'},
+        'content_validate.html': {'manager_user': 'Manager', 'email': 'user@gmail.com'},
+    }
+
+    def add_arguments(self, parser):
+        parser.add_argument('--iterations', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        iterations = options['iterations']
+        EmailRenderService.precompile()
+        for template_name in EmailRenderService.TEMPLATES:
+            context = self.contexts[template_name]
+            started = time.perf_counter()
+            for _ in range(iterations):
+                EmailRenderService.render(template_name, context)
+            elapsed = time.perf_counter() - started
+            self.stdout.write(f'{template_name}: {iterations / elapsed:.0f} renders/sec')
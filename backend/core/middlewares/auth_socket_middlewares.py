@@ -1,21 +1,38 @@
-from channels.db import database_sync_to_async
+from urllib.parse import parse_qs
+
 from channels.middleware import BaseMiddleware
 
+from core.exceptions.jwt_exception import JwtException
 from core.services.jwt_service import JWTService, SocketToken
 
+from apps.users.models import UserModel
+
 
-@database_sync_to_async
-def get_user(token):
+async def get_user(token):
+    if not token:
+        return None
     try:
-        return JWTService.validate_token(token, SocketToken)
-    except (Exception,):
+        payload = await JWTService.validate_one_time_token(token, SocketToken)
+    except JwtException:
         return None
+    if 'user_id' not in payload:
+        return None
+    user = UserModel(
+        pk=payload['user_id'],
+        is_active=True,
+        is_staff=payload.get('is_staff', False),
+        is_superuser=payload.get('is_superuser', False),
+    )
+    user.name = payload.get('name')
+    return user
 
 
 class AuthSocketMiddleware(BaseMiddleware):
+    """
+        Builds scope['user'] from the socket token claims without touching the database
+    """
+
     async def __call__(self, scope, receive, send):
-        token = dict(
-            [item.split('=') for item in scope['query_string'].decode('utf-8').split('&') if item]
-        ).get('token', None)
+        token = parse_qs(scope['query_string'].decode('utf-8')).get('token', [None])[0]
         scope['user'] = await get_user(token)
         return await super().__call__(scope, receive, send)
@@ -7,3 +7,12 @@ class BaseModel(models.Model):
 
     class Meta:
         abstract = True
+
+
+class MediaFileModel(models.Model):
+    name = models.CharField(max_length=255, unique=True)
+    ref_count = models.PositiveIntegerField(default=1)
+
+    class Meta:
+        db_table = 'media_files'
+        ordering = ('id',)
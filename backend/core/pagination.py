@@ -1,6 +1,6 @@
 import math
 
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.pagination import CursorPagination, PageNumberPagination
 from rest_framework.response import Response
 
 
@@ -19,3 +19,54 @@ class PagePagination(PageNumberPagination):
             'next': self.get_next_link(),
             'data': data
         })
+
+
+class CursorPagePagination(CursorPagination):
+    """
+        Keyset pagination on (created_at, id) with opaque prev/next tokens.
+        The total count is calculated only when ?count=true is passed.
+        The ?order= of the view's filterset is respected, with id as a tiebreaker.
+    """
+    page_size = 5
+    page_size_query_param = 'size'
+    max_page_size = 15
+    ordering = ('-created_at', '-id')
+    count_query_param = 'count'
+    order_query_param = 'order'
+
+    def get_ordering(self, request, queryset, view):
+        filterset_class = getattr(view, 'filterset_class', None)
+        order_filter = filterset_class.base_filters.get(self.order_query_param) if filterset_class else None
+        value = request.query_params.get(self.order_query_param)
+        if not order_filter or not value:
+            return super().get_ordering(request, queryset, view)
+        ordering = []
+        for param in value.split(','):
+            field = order_filter.param_map.get(param.strip().lstrip('-'))
+            if field:
+                ordering.append(f'-{field}' if param.strip().startswith('-') else field)
+        if not ordering:
+            return super().get_ordering(request, queryset, view)
+        return (*ordering, '-id' if ordering[0].startswith('-') else 'id')
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.total_items = None
+        if request.query_params.get(self.count_query_param, '').lower() in ('1', 'true'):
+            self.total_items = queryset.count()
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        response = {
+            'prev': self.get_previous_link(),
+            'next': self.get_next_link(),
+            'data': data
+        }
+        if self.total_items is not None:
+            response = {'total_items': self.total_items, **response}
+        return Response(response)
+
+
+class ChatCursorPagination(CursorPagePagination):
+    page_size = 20
+    max_page_size = 50
+    ordering = ('-id',)
@@ -0,0 +1,22 @@
+from uuid import uuid4
+
+from django.core.cache import cache
+
+
+class CacheVersionService:
+    """
+        Shared version keys used to tell processes that their in-memory data is stale
+    """
+
+    @staticmethod
+    def get_version(key: str) -> str:
+        version = cache.get(key)
+        if version is None:
+            version = uuid4().hex
+            if not cache.add(key, version, None):
+                version = cache.get(key, version)
+        return version
+
+    @staticmethod
+    def bump_version(key: str):
+        cache.set(key, uuid4().hex, None)
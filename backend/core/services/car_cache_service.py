@@ -0,0 +1,50 @@
+from django.conf import settings
+from django.core.cache import caches
+
+
+class CarCacheService:
+    """
+        Read-through cache of serialized cars, invalidated by CarModel signals
+    """
+    HITS_KEY = 'car_cache:hits'
+    MISSES_KEY = 'car_cache:misses'
+
+    @staticmethod
+    def __cache():
+        return caches[getattr(settings, 'CAR_CACHE_ALIAS', 'default')]
+
+    @staticmethod
+    def car_key(car_id) -> str:
+        return f'car_cache:car:{car_id}'
+
+    @staticmethod
+    def user_cars_key(user_id) -> str:
+        return f'car_cache:user_cars:{user_id}'
+
+    @classmethod
+    def __count(cls, key):
+        cache = cls.__cache()
+        if not cache.add(key, 1, None):
+            cache.incr(key)
+
+    @classmethod
+    def get_or_set(cls, key: str, get_data):
+        cache = cls.__cache()
+        data = cache.get(key)
+        if data is not None:
+            cls.__count(cls.HITS_KEY)
+            return data
+        cls.__count(cls.MISSES_KEY)
+        data = get_data()
+        if not isinstance(data, list) or len(data) <= getattr(settings, 'CAR_CACHE_MAX_LIST_SIZE', 100):
+            cache.set(key, data, getattr(settings, 'CAR_CACHE_TTL', 300))
+        return data
+
+    @classmethod
+    def invalidate(cls, car_id, user_id):
+        cls.__cache().delete_many([cls.car_key(car_id), cls.user_cars_key(user_id)])
+
+    @classmethod
+    def get_stats(cls) -> dict:
+        stats = cls.__cache().get_many([cls.HITS_KEY, cls.MISSES_KEY])
+        return {'hits': stats.get(cls.HITS_KEY, 0), 'misses': stats.get(cls.MISSES_KEY, 0)}
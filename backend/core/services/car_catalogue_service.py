@@ -0,0 +1,48 @@
+from core.services.cache_version_service import CacheVersionService
+
+from apps.cars.models import BrandCarModel, ModelCarModel
+
+
+class CarCatalogueService:
+    """
+        In-process brand/model catalogue, reloaded when the shared version key changes
+    """
+    VERSION_KEY = 'car_catalogue_version'
+    _version = None
+    _brands: dict[str, dict] = {}
+    _models: set[str] = set()
+
+    @staticmethod
+    def get_version() -> str:
+        return CacheVersionService.get_version(CarCatalogueService.VERSION_KEY)
+
+    @staticmethod
+    def bump_version():
+        CacheVersionService.bump_version(CarCatalogueService.VERSION_KEY)
+
+    @classmethod
+    def cache_key(cls, name: str, version: str = None) -> str:
+        return f'car_catalogue:{name}:{version or cls.get_version()}'
+
+    @classmethod
+    def __load(cls, version):
+        brand_names = dict(BrandCarModel.objects.values_list('id', 'brand_name'))
+        brands = {name: {'id': pk, 'models': set()} for pk, name in brand_names.items()}
+        models = set()
+        for brand_id, model_name in ModelCarModel.objects.values_list('brand_id', 'model_name'):
+            models.add(model_name)
+            if brand_id in brand_names:
+                brands[brand_names[brand_id]]['models'].add(model_name)
+        cls._brands, cls._models, cls._version = brands, models, version
+
+    @classmethod
+    def get_brands(cls) -> dict[str, dict]:
+        version = cls.get_version()
+        if version != cls._version:
+            cls.__load(version)
+        return cls._brands
+
+    @classmethod
+    def has_model(cls, model_name: str) -> bool:
+        cls.get_brands()
+        return model_name in cls._models
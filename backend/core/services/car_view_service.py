@@ -0,0 +1,62 @@
+from collections import defaultdict
+from uuid import uuid4
+
+from django.db import IntegrityError, transaction
+from django.db.models import F
+
+from configs.celery import app
+from redis.exceptions import RedisError, ResponseError
+
+from core.services.redis_service import redis_client
+
+from apps.cars.models import CarModel, CountViewCarModel
+
+
+class CarViewService:
+    VIEWS_KEY = 'car_views'
+
+    @staticmethod
+    def add_view(car_id: int):
+        try:
+            redis_client.hincrby(CarViewService.VIEWS_KEY, car_id, 1)
+        except RedisError:
+            pass
+
+    @staticmethod
+    def __save_views(views: dict[int, int]):
+        car_ids_by_count = defaultdict(list)
+        for car_id, count in views.items():
+            car_ids_by_count[count].append(car_id)
+        with transaction.atomic():
+            for count, car_ids in car_ids_by_count.items():
+                CountViewCarModel.objects.filter(car_id__in=car_ids).update(count_view=F('count_view') + count)
+            counted = set(CountViewCarModel.objects.filter(car_id__in=views).values_list('car_id', flat=True))
+            new_car_ids = CarModel.objects.filter(id__in=set(views) - counted).values_list('id', flat=True)
+            CountViewCarModel.objects.bulk_create(
+                [CountViewCarModel(car_id=car_id, count_view=views[car_id]) for car_id in new_car_ids]
+            )
+
+    @staticmethod
+    @app.task
+    def flush_views():
+        flush_key = f'{CarViewService.VIEWS_KEY}:flush:{uuid4().hex}'
+        try:
+            redis_client.rename(CarViewService.VIEWS_KEY, flush_key)
+        except ResponseError:
+            return 0
+        views = {int(car_id): int(count) for car_id, count in redis_client.hgetall(flush_key).items()}
+        try:
+            try:
+                CarViewService.__save_views(views)
+            except IntegrityError:
+                # an overlapping flush inserted some of the rows first, they are updated on the second pass
+                CarViewService.__save_views(views)
+        except Exception:
+            with redis_client.pipeline() as pipe:
+                for car_id, count in views.items():
+                    pipe.hincrby(CarViewService.VIEWS_KEY, car_id, count)
+                pipe.execute()
+            raise
+        finally:
+            redis_client.delete(flush_key)
+        return len(views)
@@ -0,0 +1,85 @@
+import asyncio
+import atexit
+import logging
+
+from django.conf import settings
+
+from channels.db import database_sync_to_async
+
+from apps.chat.models import ChatModel
+
+logger = logging.getLogger(__name__)
+
+
+class ChatMessageBuffer:
+    """
+        Per-process write-behind buffer, flushed with bulk_create when it reaches max_size
+        messages or flush_interval seconds after the first buffered message.
+        A failed flush keeps the messages and is retried with exponential backoff.
+    """
+    MAX_RETRY_DELAY = 60
+
+    def __init__(self, max_size: int, flush_interval: float):
+        self.max_size = max_size
+        self.flush_interval = flush_interval
+        self._messages: list[ChatModel] = []
+        self._lock = asyncio.Lock()
+        self._flush_task: asyncio.Task | None = None
+        self._failures = 0
+
+    async def add(self, room: str, message: str, owner_id: int):
+        self._messages.append(ChatModel(room=room, message=message, owner_id=owner_id))
+        if len(self._messages) >= self.max_size:
+            await self.flush()
+        elif self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self.__flush_later())
+
+    async def __flush_later(self, delay: float = None):
+        await asyncio.sleep(self.flush_interval if delay is None else delay)
+        await self.flush()
+
+    def __retry_later(self):
+        self._failures += 1
+        delay = min(self.MAX_RETRY_DELAY, self.flush_interval * 2 ** self._failures)
+        if self._flush_task and not self._flush_task.done() and self._flush_task is not asyncio.current_task():
+            self._flush_task.cancel()
+        self._flush_task = asyncio.create_task(self.__flush_later(delay))
+
+    def __take(self) -> list[ChatModel]:
+        messages, self._messages = self._messages, []
+        return messages
+
+    def __restore(self, messages: list[ChatModel]):
+        self._messages[:0] = messages
+
+    async def flush(self):
+        async with self._lock:
+            messages = self.__take()
+            if not messages:
+                return
+            written = False
+            try:
+                await database_sync_to_async(ChatModel.objects.bulk_create)(messages)
+                written = True
+                self._failures = 0
+            except Exception:
+                logger.exception('Chat messages flush failed, %s messages kept in buffer', len(messages))
+                self.__retry_later()
+            finally:
+                if not written:
+                    self.__restore(messages)
+
+    def flush_sync(self):
+        messages = self.__take()
+        if not messages:
+            return
+        written = False
+        try:
+            ChatModel.objects.bulk_create(messages)
+            written = True
+        finally:
+            if not written:
+                self.__restore(messages)
+
+chat_message_buffer = ChatMessageBuffer(settings.CHAT_BUFFER_SIZE, settings.CHAT_BUFFER_FLUSH_INTERVAL)
+atexit.register(chat_message_buffer.flush_sync)
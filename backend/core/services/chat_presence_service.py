@@ -0,0 +1,41 @@
+import time
+
+from django.conf import settings
+
+from core.services.redis_service import async_redis_client, redis_client
+
+
+class ChatPresenceService:
+    """
+        Connections of every chat room in a Redis sorted set scored by the last heartbeat,
+        entries older than CHAT_PRESENCE_TTL seconds are treated as gone
+    """
+    KEY_PREFIX = 'chat_presence:'
+
+    @classmethod
+    def __key(cls, room: str) -> str:
+        return f'{cls.KEY_PREFIX}{room}'
+
+    @classmethod
+    async def touch(cls, room: str, channel_name: str) -> int:
+        key = cls.__key(room)
+        now = time.time()
+        async with async_redis_client.pipeline(transaction=False) as pipe:
+            pipe.zadd(key, {channel_name: now})
+            pipe.zremrangebyscore(key, 0, now - settings.CHAT_PRESENCE_TTL)
+            pipe.zcard(key)
+            pipe.expire(key, settings.CHAT_PRESENCE_TTL)
+            _, _, size, _ = await pipe.execute()
+        return size
+
+    @classmethod
+    async def leave(cls, room: str, channel_name: str):
+        await async_redis_client.zrem(cls.__key(room), channel_name)
+
+    @classmethod
+    def get_rooms(cls) -> dict[str, int]:
+        min_score = time.time() - settings.CHAT_PRESENCE_TTL
+        return {
+            key.removeprefix(cls.KEY_PREFIX): redis_client.zcount(key, min_score, '+inf')
+            for key in redis_client.scan_iter(f'{cls.KEY_PREFIX}*')
+        }
@@ -0,0 +1,41 @@
+import json
+
+from django.conf import settings
+
+from core.services.redis_service import async_redis_client
+
+
+class ChatReplayService:
+    """
+        Capped per-room list of the latest messages in Redis, newest first.
+        Messages are pushed only onto a list that was filled from the database, a missing list is a miss.
+    """
+
+    @staticmethod
+    def __key(room: str) -> str:
+        return f'chat_recent:{room}'
+
+    @classmethod
+    async def push(cls, room: str, item: dict):
+        key = cls.__key(room)
+        async with async_redis_client.pipeline() as pipe:
+            pipe.lpushx(key, json.dumps(item))
+            pipe.ltrim(key, 0, settings.CHAT_REPLAY_DEPTH - 1)
+            pipe.expire(key, settings.CHAT_REPLAY_TTL)
+            await pipe.execute()
+
+    @classmethod
+    async def fill(cls, room: str, items: list[dict]):
+        if not items:
+            return
+        key = cls.__key(room)
+        async with async_redis_client.pipeline() as pipe:
+            pipe.delete(key)
+            pipe.rpush(key, *[json.dumps(item) for item in items])
+            pipe.expire(key, settings.CHAT_REPLAY_TTL)
+            await pipe.execute()
+
+    @classmethod
+    async def get(cls, room: str) -> list[dict]:
+        items = await async_redis_client.lrange(cls.__key(room), 0, settings.CHAT_REPLAY_DEPTH - 1)
+        return [json.loads(item) for item in items]
@@ -0,0 +1,83 @@
+import hashlib
+import os
+import tempfile
+
+from django.core.files.storage import FileSystemStorage
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.db.models.fields.files import FieldFile
+
+from core.models import MediaFileModel
+
+
+class ContentAddressedStorage(FileSystemStorage):
+    """
+        Stores every file once under the sha256 of its content and counts references to it.
+        Reference counts live in the caller's transaction, files are removed only after it commits.
+    """
+
+    @staticmethod
+    def get_content_name(name: str, content) -> str:
+        sha256 = hashlib.sha256()
+        for chunk in content.chunks():
+            sha256.update(chunk)
+        content.seek(0)
+        digest = sha256.hexdigest()
+        ext = os.path.splitext(name)[1].lower()
+        return os.path.join(digest[:2], digest[2:4], f'{digest}{ext}')
+
+    def is_same_content(self, field_file: FieldFile, content) -> bool:
+        return bool(field_file) and field_file.name == self.get_content_name(content.name, content)
+
+    def get_available_name(self, name, max_length=None):
+        return name
+
+    @staticmethod
+    def __acquire(name: str):
+        if MediaFileModel.objects.filter(name=name).update(ref_count=F('ref_count') + 1):
+            return
+        try:
+            with transaction.atomic():
+                MediaFileModel.objects.create(name=name)
+        except IntegrityError:
+            MediaFileModel.objects.filter(name=name).update(ref_count=F('ref_count') + 1)
+
+    def __write(self, name: str, content):
+        full_path = self.path(name)
+        directory = os.path.dirname(full_path)
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as file:
+                for chunk in content.chunks():
+                    file.write(chunk if isinstance(chunk, bytes) else chunk.encode())
+            if self.file_permissions_mode is not None:
+                os.chmod(tmp_path, self.file_permissions_mode)
+            os.replace(tmp_path, full_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def __remove_if_unused(self, name: str):
+        if not MediaFileModel.objects.filter(name=name).exists():
+            super().delete(name)
+
+    def _save(self, name, content):
+        name = self.get_content_name(name, content)
+        with transaction.atomic():
+            self.__acquire(name)
+            if not self.exists(name):
+                self.__write(name, content)
+        return name
+
+    def delete(self, name):
+        if not name:
+            return
+        with transaction.atomic():
+            released = MediaFileModel.objects.filter(name=name, ref_count__gt=1).update(ref_count=F('ref_count') - 1)
+            if not released:
+                MediaFileModel.objects.filter(name=name).delete()
+                transaction.on_commit(lambda: self.__remove_if_unused(name))
+
+content_storage = ContentAddressedStorage()
@@ -0,0 +1,39 @@
+import re
+
+from django.template.loader import get_template
+from django.utils.html import strip_tags
+
+from celery.signals import worker_process_init
+
+
+class EmailRenderService:
+    TEMPLATES = ('register.html', 'recovery_password.html', 'content_validate.html')
+    _templates = {}
+
+    @classmethod
+    def precompile(cls):
+        for template_name in cls.TEMPLATES:
+            cls._templates[template_name] = get_template(template_name)
+
+    @classmethod
+    def __get_template(cls, template_name: str):
+        if template_name not in cls._templates:
+            cls._templates[template_name] = get_template(template_name)
+        return cls._templates[template_name]
+
+    @staticmethod
+    def to_text(html_content: str) -> str:
+        text = re.sub(r'<head>.*?</head>', '', html_content, flags=re.S)
+        text = re.sub(r'<a\s[^>]*href="([^"]*)"[^>]*>(.*?)</a>', r'\2: \1', text, flags=re.S)
+        text = strip_tags(text)
+        return '\n'.join(line.strip() for line in text.splitlines() if line.strip())
+
+    @classmethod
+    def render(cls, template_name: str, context: dict) -> tuple[str, str]:
+        html_content = cls.__get_template(template_name).render(context)
+        return cls.to_text(html_content), html_content
+
+
+@worker_process_init.connect
+def precompile_email_templates(**kwargs):
+    EmailRenderService.precompile()
@@ -1,13 +1,16 @@
+import json
 import os
+from smtplib import SMTPException
 
 from django.contrib.auth import get_user_model
-from django.core.mail import EmailMultiAlternatives
-from django.template.loader import get_template
+from django.core.mail import EmailMultiAlternatives, get_connection
 
 from configs.celery import app
 
 from core.dataclasses.user_dataclasses import UserDataClass
+from core.services.email_render_service import EmailRenderService
 from core.services.jwt_service import ActivateToken, JWTService, RecoveryToken
+from core.services.redis_service import redis_client
 
 from apps.users.models import UserModel as User
 
@@ -15,20 +18,56 @@ UserModel: User = get_user_model()
 
 
 class EmailService:
+    OUTBOX_KEY = 'email_outbox'
+    BATCH_SIZE = 50
+    MAX_RETRIES = 5
+
+    @staticmethod
+    def __build_email(to: str, template_name: str, context: dict, subject=''):
+        text_content, html_content = EmailRenderService.render(template_name, context)
+        msg = EmailMultiAlternatives(subject, text_content, from_email=os.environ.get('EMAIL_HOST_USER'), to=[to])
+        msg.attach_alternative(html_content, 'text/html')
+        return msg
+
+    @staticmethod
+    @app.task(bind=True, max_retries=MAX_RETRIES)
+    def send_emails(task, emails: list[dict]):
+        sent = 0
+        try:
+            with get_connection() as connection:
+                for email in emails:
+                    connection.send_messages([EmailService.__build_email(**email)])
+                    sent += 1
+        except (SMTPException, OSError) as e:
+            raise task.retry(args=(emails[sent:],), exc=e, countdown=min(600, 10 * 2 ** task.request.retries))
+        return sent
+
     @staticmethod
     @app.task
+    def flush_outbox():
+        while True:
+            with redis_client.pipeline() as pipe:
+                pipe.lrange(EmailService.OUTBOX_KEY, 0, EmailService.BATCH_SIZE - 1)
+                pipe.ltrim(EmailService.OUTBOX_KEY, EmailService.BATCH_SIZE, -1)
+                emails, _ = pipe.execute()
+            if not emails:
+                break
+            EmailService.send_emails.delay([json.loads(email) for email in emails])
+
+    @staticmethod
     def __send_email(to: str, template_name: str, context: dict, subject=''):
-        template = get_template(template_name)
-        html_content = template.render(context)
-        msg = EmailMultiAlternatives(subject, from_email=os.environ.get('EMAIL_HOST_USER'), to=[to])
-        msg.attach_alternative(html_content, 'text/html')
-        msg.send()
+        redis_client.rpush(EmailService.OUTBOX_KEY, json.dumps({
+            'to': to,
+            'template_name': template_name,
+            'context': context,
+            'subject': subject
+        }))
 
     @classmethod
     def register_email(cls, user: UserDataClass):
         token = JWTService.create_token(user, ActivateToken)
         url = f'http://localhost:3000/activate/{token}'
-        cls.__send_email.delay(user.email, 'register.html', {
+        cls.__send_email(user.email, 'register.html', {
             'name': user.profile.name,
             'url': url
         }, 'Register')
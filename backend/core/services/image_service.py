@@ -0,0 +1,80 @@
+import os
+from io import BytesIO
+
+from django.core.files.base import ContentFile
+from django.db import transaction
+from django.db.models.fields.files import FieldFile
+
+from configs.celery import app
+from PIL import Image, ImageOps
+
+from apps.cars.models import CarModel
+from apps.users.models import ProfileModel
+
+
+class ImageService:
+    WIDTHS = (320, 640, 1280)
+    FORMATS = (('WEBP', 'webp'), ('JPEG', 'jpg'))
+    QUALITY = 80
+
+    @staticmethod
+    def variant_name(name: str, width: int, ext: str) -> str:
+        root, _ = os.path.splitext(name)
+        return f'{root}_{width}.{ext}'
+
+    @staticmethod
+    def get_variant_urls(field_file: FieldFile, variants: dict) -> dict:
+        return {
+            width: {ext: field_file.storage.url(name) for ext, name in formats.items()}
+            for width, formats in variants.items()
+        }
+
+    @staticmethod
+    def delete_variants(field_file: FieldFile, variants: dict):
+        for formats in variants.values():
+            for name in formats.values():
+                field_file.storage.delete(name)
+
+    @staticmethod
+    def create_variants(field_file: FieldFile) -> dict:
+        with field_file.open('rb') as file:
+            image = ImageOps.exif_transpose(Image.open(file)).convert('RGB')
+        variants = {}
+        for width in ImageService.WIDTHS:
+            variant = image.copy()
+            variant.thumbnail((width, image.height))
+            for image_format, ext in ImageService.FORMATS:
+                buffer = BytesIO()
+                variant.save(buffer, image_format, quality=ImageService.QUALITY)
+                name = field_file.storage.save(
+                    ImageService.variant_name(field_file.name, width, ext), ContentFile(buffer.getvalue())
+                )
+                variants.setdefault(str(width), {})[ext] = name
+            if width >= image.width:
+                break
+        return variants
+
+    @staticmethod
+    def __update_variants(model_class, pk: int, field_name: str, variants_field: str, name: str):
+        instance = model_class.objects.filter(pk=pk).first()
+        if not instance or getattr(instance, field_name).name != name:
+            return
+        field_file: FieldFile = getattr(instance, field_name)
+        variants = ImageService.create_variants(field_file)
+        with transaction.atomic():
+            instance = model_class.objects.select_for_update().filter(pk=pk).first()
+            if instance and getattr(instance, field_name).name == name:
+                setattr(instance, variants_field, variants)
+                instance.save(update_fields=(variants_field,))
+                return
+        ImageService.delete_variants(field_file, variants)
+
+    @staticmethod
+    @app.task
+    def create_car_photo_variants(car_id: int, name: str):
+        ImageService.__update_variants(CarModel, car_id, 'photo_car', 'photo_car_variants', name)
+
+    @staticmethod
+    @app.task
+    def create_avatar_variants(profile_id: int, name: str):
+        ImageService.__update_variants(ProfileModel, profile_id, 'avatar', 'avatar_variants', name)
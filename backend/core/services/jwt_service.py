@@ -1,19 +1,51 @@
+import logging
+import time
 from typing import Type
 
+from django.utils import timezone
+
 from rest_framework.generics import get_object_or_404
 
+from configs.celery import app
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
 from rest_framework_simplejwt.tokens import BlacklistMixin, Token
 
 from core.enums.action_token_enum import ActionTokenEnum
 from core.exceptions.jwt_exception import JwtException
+from core.services.redis_service import async_redis_client, redis_client
 
 from apps.users.models import UserModel
 
-ActionTokenClassType = Type[BlacklistMixin | Token]
+logger = logging.getLogger(__name__)
 
 
 class ActionToken(BlacklistMixin, Token):
-    pass
+    def use(self):
+        self.check_blacklist()
+        self.blacklist()
+
+
+class OneTimeToken(Token):
+    """
+        Single use is tracked by a Redis key per jti that lives as long as the token,
+        so no OutstandingToken/BlacklistedToken rows are written
+    """
+
+    def __used_key(self) -> str:
+        return f'used_token:{self.payload[api_settings.JTI_CLAIM]}'
+
+    def use(self):
+        if not redis_client.set(self.__used_key(), 1, nx=True, ex=int(self.lifetime.total_seconds())):
+            raise TokenError('Token is already used')
+
+    async def ause(self):
+        if not await async_redis_client.set(self.__used_key(), 1, nx=True, ex=int(self.lifetime.total_seconds())):
+            raise TokenError('Token is already used')
+
+
+ActionTokenClassType = Type[ActionToken | OneTimeToken]
 
 
 class ActivateToken(ActionToken):
@@ -26,10 +58,18 @@ class RecoveryToken(ActionToken):
     lifetime = ActionTokenEnum.RECOVERY.life_time
 
 
-class SocketToken(ActionToken):
+class SocketToken(OneTimeToken):
     token_type = ActionTokenEnum.SOCKET.token_type
     lifetime = ActionTokenEnum.SOCKET.life_time
 
+    @classmethod
+    def for_user(cls, user):
+        token = super().for_user(user)
+        token['name'] = user.profile.surname if user.profile else user.email
+        token['is_staff'] = user.is_staff
+        token['is_superuser'] = user.is_superuser
+        return token
+
 
 class JWTService:
     @staticmethod
@@ -40,10 +80,31 @@ class JWTService:
     def validate_token(token, token_class: ActionTokenClassType):
         try:
             token_res = token_class(token)
-            token_res.check_blacklist()
+            token_res.use()
         except (Exception,):
             raise JwtException
 
-        token_res.blacklist()
         user_id = token_res.payload.get('user_id')
         return get_object_or_404(UserModel, pk=user_id)
+
+    @staticmethod
+    async def validate_one_time_token(token, token_class: Type[OneTimeToken]) -> dict:
+        try:
+            token_res = token_class(token)
+            await token_res.ause()
+        except (Exception,):
+            raise JwtException
+        return token_res.payload
+
+    @staticmethod
+    @app.task
+    def prune_expired_tokens(batch_size=1000):
+        started = time.monotonic()
+        removed = {'outstanding': 0, 'blacklisted': 0}
+        expired = OutstandingToken.objects.filter(expires_at__lte=timezone.now()).order_by('id')
+        while ids := list(expired.values_list('id', flat=True)[:batch_size]):
+            removed['blacklisted'] += BlacklistedToken.objects.filter(token_id__in=ids).delete()[0]
+            removed['outstanding'] += OutstandingToken.objects.filter(id__in=ids).delete()[0]
+        removed['seconds'] = round(time.monotonic() - started, 3)
+        logger.info('Pruned expired tokens: %s', removed)
+        return removed
@@ -0,0 +1,20 @@
+from configs.celery import app
+
+from apps.users.models import CountModel
+from apps.users.validators import UserValidator
+
+
+class ModerationService:
+    STRIKES_LIMIT = 3
+
+    @staticmethod
+    def add_strike(user_id):
+        CountModel.objects.add_strike(user_id)
+        ModerationService.check_strikes.delay(user_id)
+
+    @staticmethod
+    @app.task
+    def check_strikes(user_id):
+        deleted, _ = CountModel.objects.filter(user_id=user_id, count__gte=ModerationService.STRIKES_LIMIT).delete()
+        if deleted:
+            UserValidator.validate_content_user(user_id)
@@ -0,0 +1,40 @@
+from core.services.redis_service import async_redis_client, redis_client
+
+
+class SocketMetricsService:
+    """
+        Counters and per-connection gauges of the websocket consumers, shared between processes in Redis
+    """
+
+    @staticmethod
+    def __key(name: str) -> str:
+        return f'socket_metrics:{name}'
+
+    @classmethod
+    async def incr(cls, name: str, **counters: int):
+        async with async_redis_client.pipeline(transaction=False) as pipe:
+            for counter, value in counters.items():
+                if value:
+                    pipe.hincrby(cls.__key(name), counter, value)
+            await pipe.execute()
+
+    @classmethod
+    async def set_gauge(cls, name: str, channel_name: str, value: int | float):
+        await async_redis_client.hset(f'{cls.__key(name)}:gauge', channel_name, value)
+
+    @classmethod
+    async def remove_connection(cls, name: str, channel_name: str):
+        await async_redis_client.hdel(f'{cls.__key(name)}:gauge', channel_name)
+
+    @classmethod
+    def get_counters(cls, name: str) -> dict:
+        return {counter: int(value) for counter, value in redis_client.hgetall(cls.__key(name)).items()}
+
+    @classmethod
+    def get_gauges(cls, name: str) -> dict:
+        gauges = [float(value) for value in redis_client.hvals(f'{cls.__key(name)}:gauge')]
+        return {
+            'connections': len(gauges),
+            'gauge_total': sum(gauges),
+            'gauge_max': max(gauges, default=0),
+        }
@@ -12,4 +12,4 @@ def upload_avatar(instance: ProfileDataClass, file: str) -> str:
 
 def upload_photo_car(instance: CarDataClass, file: str) -> str:
     ext = file.split('.')[-1]
-    return os.path.join(instance.user.profile.surname, 'cars', f'{uuid1()}.{ext}')
+    return os.path.join(str(instance.user_id), 'cars', f'{uuid1()}.{ext}')
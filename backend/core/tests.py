@@ -0,0 +1,58 @@
+from io import StringIO
+from smtplib import SMTPException
+from unittest.mock import patch
+
+from django.core import mail
+from django.core.mail import get_connection
+from django.core.mail.backends.locmem import EmailBackend
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+from core.services.email_render_service import EmailRenderService
+from core.services.email_service import EmailService
+
+
+@override_settings(EMAIL_BACKEND='django.core.mail.backends.locmem.EmailBackend')
+class SendEmailsTaskTestCase(TestCase):
+    emails = [
+        {'to': f'user{index}@gmail.com', 'template_name': 'register.html',
+         'context': {'name': 'Name', 'url': 'http://localhost:3000'}, 'subject': f'Register {index}'}
+        for index in range(3)
+    ]
+
+    def test_batch_is_sent_over_one_connection(self):
+        with patch('core.services.email_service.get_connection', wraps=get_connection) as connection:
+            result = EmailService.send_emails.apply(args=(self.emails,))
+        self.assertEqual(result.get(), 3)
+        connection.assert_called_once()
+        self.assertEqual([email.to for email in mail.outbox], [[email['to']] for email in self.emails])
+
+    def test_retry_sends_only_the_unsent_rest(self):
+        send_messages = EmailBackend.send_messages
+        calls = []
+
+        def fail_on_second_message(backend, messages):
+            calls.append(messages)
+            if len(calls) == 2:
+                raise SMTPException('Connection lost')
+            return send_messages(backend, messages)
+
+        with patch.object(EmailBackend, 'send_messages', fail_on_second_message):
+            EmailService.send_emails.apply(args=(self.emails,))
+        self.assertEqual(len(calls), 4)
+        self.assertEqual([email.subject for email in mail.outbox], [email['subject'] for email in self.emails])
+
+
+class EmailRenderServiceTestCase(TestCase):
+    def test_text_alternative_contains_activation_url(self):
+        url = 'http://localhost:3000/activate/token'
+        text_content, html_content = EmailRenderService.render('register.html', {'name': 'Name', 'url': url})
+        self.assertIn(url, text_content)
+        self.assertNotIn('<', text_content)
+
+    def test_benchmark_reports_renders_per_second(self):
+        out = StringIO()
+        call_command('bench_email_render', iterations=10, stdout=out)
+        lines = out.getvalue().splitlines()
+        self.assertEqual(len(lines), len(EmailRenderService.TEMPLATES))
+        self.assertTrue(all(line.endswith('renders/sec') for line in lines))